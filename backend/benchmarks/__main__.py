@@ -2,7 +2,6 @@
 
 import argparse
 
-from backend.rconclient import RCONWorkerPoolConfig
 from backend.config import configure_logging, get_env_str, load_config_from_env
 
 from .config import BenchmarkConfig
@@ -31,16 +30,6 @@ def main() -> None:
 
     config = load_config_from_env(args.env_file)
 
-    worker_config = RCONWorkerPoolConfig(
-        password=config.rcon_password,
-        port=config.rcon_port,
-        socket_timeout=config.rcon_socket_timeout,
-        worker_count=config.worker_count,
-        reconnect_pause=config.reconnect_pause,
-        grace_period=config.shutdown_grace_period,
-        await_shutdown_period=config.shutdown_await_period,
-    )
-
     benchmark_config = BenchmarkConfig(
         minecraft_server_jar_path=get_env_str("MINECRAFT_SERVER_PATH", ""),
         rcon_port=config.rcon_port,
@@ -51,7 +40,7 @@ def main() -> None:
     configure_logging(config)
 
     with setup_benchmark(benchmark_config):
-        worker_benchmark(benchmark_config, worker_config)
+        worker_benchmark(benchmark_config, config.worker_config)
 
 
 if __name__ == "__main__":
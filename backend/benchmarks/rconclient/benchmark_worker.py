@@ -57,7 +57,7 @@ async def _run_pool(config: RCONWorkerPoolConfig) -> float:
     """Time the end-to-end execution of NUM_COMMANDS through a worker pool.
 
     Measures from the moment commands are queued until every command's
-    completion event has been set, giving the true wall-clock throughput.
+    completion has been signalled, giving the true wall-clock throughput.
 
     :param config: Worker pool configuration to benchmark
     :return: Elapsed wall-clock seconds
@@ -68,7 +68,7 @@ async def _run_pool(config: RCONWorkerPoolConfig) -> float:
         start = timeit.default_timer()
         for cmd in commands:
             await pool.queue_command(cmd)
-        await asyncio.gather(*(cmd.completion.wait() for cmd in commands))
+        await asyncio.gather(*(cmd.wait_for_completion() for cmd in commands))
         return timeit.default_timer() - start
 
 
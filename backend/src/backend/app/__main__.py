@@ -4,7 +4,8 @@ import argparse
 
 import uvicorn
 
-from backend.app import create_app
+from backend.app import configure_fastapi_app, load_config_from_env
+from backend.config import configure_logging
 
 
 def main() -> None:
@@ -41,15 +42,36 @@ def main() -> None:
         default=1,
         help="Number of worker processes to run.",
     )
+    parser.add_argument(
+        "--timeout-graceful-shutdown",
+        type=int,
+        default=None,
+        help=(
+            "Seconds to wait for in-flight requests to finish on shutdown "
+            "before cancelling them. Defaults to SHUTDOWN_GRACE_PERIOD."
+        ),
+    )
     args = parser.parse_args()
 
-    app = create_app(args.env_file)
+    config = load_config_from_env(args.env_file)
+    configure_logging(config)
+    app = configure_fastapi_app(config)
+
+    # uvicorn waits for in-flight requests, cancelling them at this timeout,
+    # before it runs the lifespan shutdown that fails still-queued commands.
+    # The RCON workers keep draining the queue meanwhile, so this wait is
+    # the effective grace period for requests awaiting command results.
+    timeout_graceful_shutdown = args.timeout_graceful_shutdown
+    if timeout_graceful_shutdown is None and config.shutdown_grace_period is not None:
+        timeout_graceful_shutdown = max(config.shutdown_grace_period, 0)
+
     uvicorn.run(
         app,
         host=args.host,
         port=args.port,
         reload=args.reload,
         workers=args.workers,
+        timeout_graceful_shutdown=timeout_graceful_shutdown,
     )
 
 
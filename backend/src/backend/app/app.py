@@ -1,15 +1,19 @@
 """FastAPI application factory for RCON functionality."""
 
+import asyncio
 import logging
 import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from aiosqlite import connect as aiosqlite_connect
+from anyio.to_thread import current_default_thread_limiter
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from backend.app.auth import (
     AuthQueries,
@@ -19,9 +23,8 @@ from backend.app.auth import (
     configure_key_router,
 )
 from backend.app.command_router import configure_command_router
-from backend.config import load_config_from_env
+from backend.config import configure_logging, load_config_from_env
 from backend.rconclient import RCONWorkerPool
-from backend.rconclient.worker import RCONWorkerPoolConfig
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -29,7 +32,9 @@ if TYPE_CHECKING:
     from backend.config import AppConfig
 
 LOGGER = logging.getLogger(__name__)
-POOL = RCONWorkerPool()
+
+# serialized once; the root route is hit by health probes
+_ROOT_RESPONSE = JSONResponse("Minecraft RCON Server API")
 
 
 def _db_needs_owner(database_path: str) -> bool:
@@ -65,17 +70,7 @@ def configure_fastapi_app(config: AppConfig) -> FastAPI:
     :param config: Application configuration
     :return: Configured FastAPI application
     """
-    worker_config = RCONWorkerPoolConfig(
-        password=config.rcon_password,
-        port=config.rcon_port,
-        socket_timeout=config.rcon_socket_timeout,
-        worker_count=config.worker_count,
-        reconnect_pause=config.reconnect_pause,
-        grace_period=config.shutdown_grace_period,
-        await_shutdown_period=config.shutdown_await_period,
-    )
-
-    worker_pool = RCONWorkerPool(worker_config)
+    worker_pool = RCONWorkerPool(config.worker_config)
 
     security_manager = SecurityManager(
         secret_key=config.secret_key,
@@ -105,34 +100,55 @@ def configure_fastapi_app(config: AppConfig) -> FastAPI:
         """
         LOGGER.info("Minecraft RCON Server API is starting")
 
-        async with (
-            aiosqlite_connect(config.database_path) as db_connection,
-            worker_pool as pool,
-        ):
-            auth_queries = AuthQueries(db_connection, security_manager)
-            await auth_queries.initialize_tables(owner_credentials)
-
-            validate = Validate(auth_queries)
-
-            auth_router = configure_auth_router(APIRouter(), validate)
-
-            auth_router = configure_key_router(
-                auth_router,
-                validate,
-            )
-
-            command_router = configure_command_router(
-                APIRouter(),
-                pool,
-                validate,
+        if config.thread_pool_size is not None:
+            # sync dependencies run through anyio, to_thread through asyncio
+            current_default_thread_limiter().total_tokens = config.thread_pool_size
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=config.thread_pool_size),
             )
 
-            app.include_router(auth_router, prefix="/auth", tags=["auth"])
-            app.include_router(command_router, prefix="/commands", tags=["commands"])
-
-            yield
+        async with aiosqlite_connect(config.database_path) as db_connection:
+            auth_queries = AuthQueries(db_connection, security_manager)
 
-            LOGGER.info("Minecraft RCON Server API is shutting down")
+            # table setup does not depend on the RCON connections, so run it
+            # while the worker pool connects instead of before it
+            init_tables = asyncio.create_task(
+                auth_queries.initialize_tables(owner_credentials),
+            )
+            try:
+                async with worker_pool as pool:
+                    await init_tables
+
+                    validate = Validate(auth_queries)
+
+                    auth_router = configure_auth_router(APIRouter(), validate)
+
+                    auth_router = configure_key_router(
+                        auth_router,
+                        validate,
+                    )
+
+                    command_router = configure_command_router(
+                        APIRouter(),
+                        pool,
+                        validate,
+                    )
+
+                    app.include_router(auth_router, prefix="/auth", tags=["auth"])
+                    app.include_router(
+                        command_router,
+                        prefix="/commands",
+                        tags=["commands"],
+                    )
+
+                    try:
+                        yield
+                    finally:
+                        LOGGER.info("Minecraft RCON Server API is shutting down")
+            finally:
+                # only has an effect if the worker pool failed to connect
+                init_tables.cancel()
+                await asyncio.gather(init_tables, return_exceptions=True)
 
     app = FastAPI(
         title="Minecraft RCON Server API",
@@ -150,8 +166,8 @@ def configure_fastapi_app(config: AppConfig) -> FastAPI:
     )
 
     @app.get("/")
-    def read_root() -> str:
-        return "Minecraft RCON Server API"
+    async def read_root() -> JSONResponse:
+        return _ROOT_RESPONSE
 
     return app
 
@@ -166,4 +182,5 @@ def create_app(env_file: str | None = os.environ.get("ENV_FILE", ".env")) -> Fas
     :return: Configured FastAPI application
     """
     config = load_config_from_env(env_file)
+    configure_logging(config)
     return configure_fastapi_app(config)
@@ -18,7 +18,6 @@ if TYPE_CHECKING:
     from .validation import Validate
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 
 async def _list_api_keys(
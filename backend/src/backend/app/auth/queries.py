@@ -4,6 +4,7 @@ Using the AuthQueries class as a repository for
 authentication-related queries.
 """
 
+import asyncio
 import logging
 import secrets
 from enum import StrEnum
@@ -22,7 +23,6 @@ if TYPE_CHECKING:
     from .security_manager import SecurityManager
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 
 class APIKeyOrderBy(StrEnum):
@@ -168,7 +168,12 @@ class AuthQueries:
 
                 username, password = owner_credentials
                 salt = gensalt()
-                hashed_password = hashpw(password.encode(), salt)
+                # bcrypt releases the GIL, so hash off the event loop
+                hashed_password = await asyncio.to_thread(
+                    hashpw,
+                    password.encode(),
+                    salt,
+                )
                 await db.execute(
                     AuthQueries.ADD_USER,
                     (username, hashed_password, salt, Role.OWNER),
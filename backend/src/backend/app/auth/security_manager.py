@@ -5,8 +5,10 @@ Includes password requirement checks, JWT token creation and verification.
 
 import getpass
 import logging
+import math
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 import jwt
@@ -14,7 +16,6 @@ import jwt
 from backend.common import Role, User
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 
 @dataclass
@@ -32,6 +33,7 @@ class SecurityManager:
     DEFAULT_PASSPHRASE_MIN_LENGTH = 20
     MINIMUM_JWT_SECRET_KEY_LENGTH = 32
     DEFAULT_API_KEY_LENGTH = 64
+    VERIFIED_TOKEN_CACHE_SIZE = 4096
 
     secret_key: str | None = None
     algorithm: str = DEFAULT_JWT_ALGORITHM
@@ -39,6 +41,14 @@ class SecurityManager:
     passphrase_min_length: int = DEFAULT_PASSPHRASE_MIN_LENGTH
     api_key_length: int = DEFAULT_API_KEY_LENGTH
 
+    # token -> (user, expiry as a UNIX timestamp)
+    _verified_tokens: dict[str, tuple[User, float]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
     def __post_init__(self) -> None:
         """Generate secret key if not provided."""
         if (
@@ -107,10 +117,36 @@ class SecurityManager:
     def verify_token(self, token: str) -> User | None:
         """Verify and decode a JWT token, returning the user.
 
+        Tokens that verified successfully are remembered until they expire,
+        so repeated requests with the same bearer skip the signature check.
+        Tokens cannot be revoked before expiry, so this does not extend
+        their validity.
+
         :param token: The JWT token string to verify
-        :param jwt_config: JWT configuration to use
         :return: The User object if the token is valid, None otherwise
         """
+        cached = self._verified_tokens.get(token)
+        if cached is not None:
+            user, expires_at = cached
+            if time.time() < expires_at:
+                return user
+            self._verified_tokens.pop(token, None)
+
+        verified = self._decode_token(token)
+        if verified is None:
+            return None
+
+        if len(self._verified_tokens) >= self.VERIFIED_TOKEN_CACHE_SIZE:
+            self._verified_tokens.clear()
+        self._verified_tokens[token] = verified
+        return verified[0]
+
+    def _decode_token(self, token: str) -> tuple[User, float] | None:
+        """Check the signature and claims of a JWT token.
+
+        :param token: The JWT token string to verify
+        :return: A tuple of (user, expiry timestamp) if valid, None otherwise
+        """
         try:
             payload = jwt.decode(
                 token,
@@ -127,7 +163,8 @@ class SecurityManager:
             if username is None or role_int is None:
                 return None
 
-            return User(username=username, role=Role(role_int))
+            user = User(username=username, role=Role(role_int))
+            return user, payload.get("exp", math.inf)
 
         except jwt.ExpiredSignatureError:
             return None
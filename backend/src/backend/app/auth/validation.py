@@ -20,7 +20,6 @@ api_key_header = APIKeyHeader(name="X-API-Key", auto_error=True)
 bearer_scheme = HTTPBearer(auto_error=True)
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 
 class Validate:
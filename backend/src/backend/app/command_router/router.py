@@ -17,7 +17,6 @@ if TYPE_CHECKING:
     from backend.app.auth import Validate
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 
 class CommandResult(BaseModel):
@@ -50,6 +49,11 @@ async def _queue_command(
             status_code=500,
             detail="Error queuing command: worker shutting down",
         ) from e
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Error queuing command: command queue is full",
+        ) from e
 
     return rcon_command
 
@@ -77,6 +81,11 @@ async def _queue_commands(
             status_code=422,
             detail=str(e),
         ) from e
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Error queuing commands: command queue is full",
+        ) from e
 
     return rcon_commands
 
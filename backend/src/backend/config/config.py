@@ -8,21 +8,24 @@ into a single dataclass.
 import logging
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 from jwt.algorithms import get_default_algorithms
 
+from backend.rconclient import RCONWorkerPoolConfig
+
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 _PORT_UPPER_BOUND = 65536
 _DEFAULT_WORKER_COUNT = 5
 _DEFAULT_RECONNECT_PAUSE_SECONDS = 5
+_DEFAULT_MAX_QUEUE_SIZE = 1000
 _DEFAULT_RCON_PORT = 25575
 _MINUTES_IN_DAY = 60 * 24
 _DEFAULT_PASSPHRASE_MIN_LENGTH = 20
@@ -43,7 +46,9 @@ class AppConfig:
     :param rcon_port: Port number for the RCON server
     :param rcon_socket_timeout: Timeout for RCON socket operations
     :param worker_count: Number of worker threads for RCON operations
-    :param reconnect_pause: Pause time in seconds between reconnection attempts
+    :param reconnect_pause: Base pause in seconds between reconnection attempts
+    :param max_queue_size: Maximum number of commands waiting for a worker,
+        or 0 for no limit
     :param secret_key: Secret key for JWT encoding/decoding
     :param algorithm: JWT algorithm for encoding/decoding
     :param access_token_expire_minutes: Expiration time for access tokens in minutes
@@ -52,6 +57,8 @@ class AppConfig:
     :param shutdown_grace_period: Period for graceful shutdown in seconds
     :param shutdown_queue_clear_period: Period to clear the shutdown queue in seconds
     :param shutdown_await_period: Period for awaiting shutdown in seconds
+    :param thread_pool_size: Threads available for blocking work such as
+        synchronous dependencies, or None to keep the library defaults
     """
 
     database_path: str
@@ -63,6 +70,7 @@ class AppConfig:
     rcon_socket_timeout: int | None
     worker_count: int
     reconnect_pause: int
+    max_queue_size: int
 
     secret_key: str
     algorithm: str
@@ -73,6 +81,28 @@ class AppConfig:
     shutdown_grace_period: int | None
     shutdown_await_period: int | None
 
+    thread_pool_size: int | None
+
+    @cached_property
+    def worker_config(self) -> RCONWorkerPoolConfig:
+        """Worker pool configuration derived from the RCON settings.
+
+        Built on first access so that inspecting the config does not
+        construct RCON client state.
+
+        :return: The RCONWorkerPoolConfig for this application
+        """
+        return RCONWorkerPoolConfig(
+            password=self.rcon_password,
+            port=self.rcon_port,
+            socket_timeout=self.rcon_socket_timeout,
+            worker_count=self.worker_count,
+            reconnect_pause=self.reconnect_pause,
+            grace_period=self.shutdown_grace_period,
+            await_shutdown_period=self.shutdown_await_period,
+            max_queue_size=self.max_queue_size,
+        )
+
 
 def configure_logging(app_config: AppConfig) -> None:
     """Configure logging based on the application configuration.
@@ -139,11 +169,11 @@ def get_env_optional_int(
     if value_str == "":
         return None
 
-    if not value_str.isnumeric():
+    try:
+        value = int(value_str)
+    except ValueError as e:
         msg = f"Environment variable {var_name} must be an integer, got: {value_str}"
-        raise ValueError(msg)
-
-    value = int(value_str)
+        raise ValueError(msg) from e
 
     if value_checker and not value_checker(value):
         msg = f"Environment variable {var_name} has invalid value: {value}"
@@ -169,11 +199,11 @@ def get_env_int(
     if value_str is None or value_str == "":
         return default
 
-    if not value_str.isnumeric():
+    try:
+        value = int(value_str)
+    except ValueError as e:
         msg = f"Environment variable {var_name} must be an integer, got: {value_str}"
-        raise ValueError(msg)
-
-    value = int(value_str)
+        raise ValueError(msg) from e
 
     if value_checker and not value_checker(value):
         msg = f"Environment variable {var_name} has invalid value: {value}"
@@ -190,6 +220,8 @@ def load_config_from_env(env_file: str | Path | None) -> AppConfig:
     if env_file:
         load_dotenv(dotenv_path=env_file)
 
+    allowed_algorithms = frozenset(get_default_algorithms())
+
     return AppConfig(
         database_path=get_env_str("DATABASE_PATH", "./mcrconserver_sqlite.db"),
         logging_level=get_env_str(
@@ -222,11 +254,20 @@ def load_config_from_env(env_file: str | Path | None) -> AppConfig:
             _DEFAULT_RECONNECT_PAUSE_SECONDS,
             lambda pause: pause >= 0,
         ),
-        secret_key=get_env_str("SECRET_KEY", os.urandom(32).hex()),
+        max_queue_size=get_env_int(
+            "MAX_QUEUE_SIZE",
+            _DEFAULT_MAX_QUEUE_SIZE,
+            lambda size: size >= 0,
+        ),
+        secret_key=get_env_str(
+            "SECRET_KEY",
+            # only draw random bytes when the key is not configured
+            None if "SECRET_KEY" in os.environ else os.urandom(32).hex(),
+        ),
         algorithm=get_env_str(
             "ALGORITHM",
             "HS512",
-            lambda algorithm: algorithm in get_default_algorithms(),
+            lambda algorithm: algorithm in allowed_algorithms,
         ),
         access_token_expire_minutes=get_env_int(
             "ACCESS_TOKEN_EXPIRE_MINUTES",
@@ -253,4 +294,9 @@ def load_config_from_env(env_file: str | Path | None) -> AppConfig:
             -1,
             lambda period: period >= -1,
         ),
+        thread_pool_size=get_env_optional_int(
+            "THREAD_POOL_SIZE",
+            None,  # if not set, keep the anyio and asyncio defaults
+            lambda size: size > 0,
+        ),
     )
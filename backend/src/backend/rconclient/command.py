@@ -1,7 +1,9 @@
 """Defines users, RCON packet types, and RCON command structures."""
 
 import asyncio
+from array import array
 from asyncio import Future
+from collections import deque
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import TYPE_CHECKING
@@ -14,6 +16,65 @@ if TYPE_CHECKING:
     from backend.common import User
 
 
+def _build_adjacency(
+    node_count: int,
+    edges: list[tuple[int, int]],
+) -> tuple[array[int], array[int], array[int]]:
+    """Pack directed edges between dense node indices into a CSR adjacency.
+
+    :param node_count: Number of nodes, indexed from 0
+    :param edges: (source, target) pairs
+    :return: A tuple of (in_degree, offsets, targets), where the targets of
+        node ``i`` are ``targets[offsets[i] : offsets[i + 1]]``
+    """
+    in_degree = array("i", [0]) * node_count
+    offsets = array("i", [0]) * (node_count + 1)
+    for source, target in edges:
+        offsets[source + 1] += 1
+        in_degree[target] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+
+    targets = array("i", [0]) * len(edges)
+    cursor = offsets[:-1]
+    for source, target in edges:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+
+    return in_degree, offsets, targets
+
+
+def _cycle_nodes(edges: list[tuple[int, int]], in_degree: array[int]) -> set[int]:
+    """Narrow the nodes a topological sort could not emit to those on cycles.
+
+    Nodes left with a nonzero in-degree are on a cycle or downstream of one.
+    Repeatedly removing those with no remaining dependents leaves only nodes
+    on (or between) cycles.
+
+    :param edges: (source, target) pairs between dense node indices
+    :param in_degree: In-degrees left over after the sort
+    :return: Indices of the nodes on cycles
+    """
+    stuck = {i for i, degree in enumerate(in_degree) if degree}
+    dependent_count = dict.fromkeys(stuck, 0)
+    sources: dict[int, list[int]] = {i: [] for i in stuck}
+    for source, target in edges:
+        if source in stuck and target in stuck:
+            dependent_count[source] += 1
+            sources[target].append(source)
+
+    leaves = [i for i, count in dependent_count.items() if count == 0]
+    while leaves:
+        leaf = leaves.pop()
+        stuck.discard(leaf)
+        for source in sources[leaf]:
+            dependent_count[source] -= 1
+            if dependent_count[source] == 0:
+                leaves.append(source)
+
+    return stuck
+
+
 class RCONPacketType(IntEnum):
     """Types for an RCON TCP packet.
 
@@ -50,7 +111,7 @@ class RCONCommandSpecification(BaseModel):
     )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class RCONCommand:
     """Represents a command for the RCON server.
 
@@ -63,104 +124,151 @@ class RCONCommand:
     :param user: The user who issued the command, if applicable
     :param command_id: Generally unused except for batch processing, in which case
         ids must be unique
-    :param completion: Signals when the command has completed
-    :param result: Holds the result of the command, if required
+    :param result: Holds the result of the command, if required. Resolving it
+        also marks the command as complete
     :param dependencies: RCONCommands that must complete before this one
     """
 
     command: str
     user: User | None
     command_id: int = 0
-    completion: asyncio.Event = field(default_factory=asyncio.Event)
     result: Future | None = field(default=None, repr=False)
-    dependencies: list[RCONCommand] = field(default_factory=list)
+    dependencies: tuple[RCONCommand, ...] = ()
+    # Completion state for fire-and-forget commands, which have no result.
+    # The event is only allocated once something actually waits on it.
+    _done: bool = field(default=False, init=False, repr=False)
+    _completion: asyncio.Event | None = field(default=None, init=False, repr=False)
+
+    def _signal_completion(self) -> None:
+        """Mark a fire-and-forget command complete and wake any waiters."""
+        self._done = True
+        if self._completion is not None:
+            self._completion.set()
 
     def add_dependency(self, dependency: RCONCommand) -> None:
         """Add a dependency a worker will wait for before executing this command.
 
         :param dependency: The command that must complete before this one
         """
-        self.dependencies.append(dependency)
+        self.dependencies = (*self.dependencies, dependency)
 
     def set_command_result(self, result: str) -> None:
         """Set the result on the associated Future if one is present.
 
         Always signals completion, even for fire-and-forget commands
         (where result is None), so that dependency chains and
-        external waiters on ``completion`` resolve correctly.
+        waiters in :meth:`wait_for_completion` resolve correctly.
 
         :param result: The result of the command from the Minecraft server
         """
-        if self.result is not None and not self.result.done():
+        if self.result is None:
+            self._signal_completion()
+        elif not self.result.done():
             self.result.set_result(result)
-        self.completion.set()
 
     def set_command_error(self, error: Exception) -> None:
         """Set an error on the associated Future if one is present.
 
         Always signals completion, even for fire-and-forget commands
         (where result is None), so that dependency chains and
-        external waiters on ``completion`` resolve correctly.
+        waiters in :meth:`wait_for_completion` resolve correctly.
 
         :param error: The exception that occurred while processing the command.
         """
-        if self.result is not None and not self.result.done():
+        if self.result is None:
+            self._signal_completion()
+        elif not self.result.done():
             self.result.set_exception(error)
-        self.completion.set()
+
+    async def wait_for_completion(self) -> None:
+        """Wait until the command has been processed, without raising its error."""
+        if self.result is None:
+            if self._done:
+                return
+            if self._completion is None:
+                self._completion = asyncio.Event()
+            await self._completion.wait()
+        elif not self.result.done():
+            await asyncio.wait((self.result,))
 
     async def get_command_result(self) -> str | None:
         """Await and get the result from the associated Future if one is present.
 
+        The Future is shielded, so a cancelled caller does not mark the
+        command as complete before a worker has processed it.
+
         :return: The result string if a Future exists, else None
 
         :raises Exception: If the command resulted in an error.
         """
-        if self.result is not None:
-            return await self.result
-        return None
+        result = self.result
+        if result is None:
+            return None
+        if result.done():
+            # re-raises a stored exception, like awaiting would
+            return result.result()
+        return await asyncio.shield(result)
 
     @staticmethod
     def topological_sort(commands: Iterable[RCONCommand]) -> list[RCONCommand]:
         """Sorts commands using topological ordering, with sources first.
 
+        Dependencies that are not part of ``commands`` are included in the
+        result as well, ahead of the commands that depend on them.
+
         .. note::
             Command IDs must be unique for proper sorting.
 
         :param commands: The list of RCONCommands to sort
-        :return: The sorted list of RCONCommands or None if a cycle is detected
+        :return: The sorted list of RCONCommands
         :raises ValueError: If a cycle is detected in command
             dependencies or duplicate IDs exist.
         """
-        # Check for duplicates first
-        command_ids = [cmd.command_id for cmd in commands]
-        if len(set(command_ids)) != len(command_ids):
+        nodes = list(commands)
+        if len({command.command_id for command in nodes}) != len(nodes):
             msg = "Duplicate command IDs detected"
             raise ValueError(msg)
 
+        # Independent commands are already in a valid order
+        if not any(command.dependencies for command in nodes):
+            return nodes
+
+        # Nodes are tracked by identity, so a dependency from outside
+        # ``commands`` is never mistaken for a command sharing its ID.
+        index = {id(command): i for i, command in enumerate(nodes)}
+
+        # Kahn's algorithm over dense indices. Edges point from a dependency
+        # to the command waiting on it and are stored as a CSR adjacency.
+        edges: list[tuple[int, int]] = []
+        position = 0
+        while position < len(nodes):
+            for dependency in nodes[position].dependencies:
+                source = index.get(id(dependency))
+                if source is None:
+                    source = index[id(dependency)] = len(nodes)
+                    nodes.append(dependency)
+                edges.append((source, position))
+            position += 1
+
+        node_count = len(nodes)
+        in_degree, offsets, dependents = _build_adjacency(node_count, edges)
+
+        ready = deque(i for i in range(node_count) if in_degree[i] == 0)
         sorted_commands = []
-        finished = set()
-        visiting = set()
-
-        def depth_first_search(command: RCONCommand) -> None:
-            if command.command_id in finished:
-                return
-
-            if command.command_id in visiting:
-                msg = "Cycle detected in command dependencies"
-                raise ValueError(msg)
-
-            visiting.add(command.command_id)
-
-            for dependency in command.dependencies:
-                depth_first_search(dependency)
-
-            visiting.remove(command.command_id)
-            finished.add(command.command_id)
-            sorted_commands.append(command)
-
-        for command in commands:
-            if command.command_id not in finished:
-                depth_first_search(command)
+        while ready:
+            current = ready.popleft()
+            sorted_commands.append(nodes[current])
+            for dependent in dependents[offsets[current] : offsets[current + 1]]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(sorted_commands) != node_count:
+            cycle_ids = sorted(
+                nodes[i].command_id for i in _cycle_nodes(edges, in_degree)
+            )
+            msg = f"Cycle detected in command dependencies among IDs {cycle_ids}"
+            raise ValueError(msg)
 
         return sorted_commands
 
@@ -169,18 +277,19 @@ class RCONCommand:
         cls,
         specification: RCONCommandSpecification,
         user: User | None,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> RCONCommand:
         """Create a command from a command specification.
 
         :param specification: The command specification
         :param user: The user who issued the command, if applicable
+        :param loop: The running event loop, if already known to the caller
         :return: The created RCONCommand
         """
-        result = (
-            asyncio.get_running_loop().create_future()
-            if specification.require_result
-            else None
-        )
+        result = None
+        if specification.require_result:
+            loop = loop or asyncio.get_running_loop()
+            result = loop.create_future()
         return RCONCommand(
             command=specification.cmd,
             user=user,
@@ -206,9 +315,14 @@ class RCONCommand:
         :return: The created RCONCommand instances
         """
         rcon_commands: dict[int, RCONCommand] = {}
+        loop = asyncio.get_running_loop()
 
         for cmd_spec in job_specification:
-            rcon_command = RCONCommand.create_command_from_specification(cmd_spec, user)
+            rcon_command = RCONCommand.create_command_from_specification(
+                cmd_spec,
+                user,
+                loop,
+            )
             if cmd_spec.id in rcon_commands:
                 msg = f"Duplicate command ID {cmd_spec.id} found"
                 raise ValueError(msg)
@@ -220,11 +334,14 @@ class RCONCommand:
                 msg = f"Command ID {cmd_spec.id} not found"
                 raise ValueError(msg)
 
-            for dependee_id in cmd_spec.dependencies:
-                dependee = rcon_commands.get(dependee_id)
-                if not dependee:
-                    msg = f"Dependency command ID {dependee_id} not found"
-                    raise ValueError(msg)
-                depender.add_dependency(dependee)
+            if not cmd_spec.dependencies:
+                continue
+
+            try:
+                dependees = tuple(rcon_commands[i] for i in cmd_spec.dependencies)
+            except KeyError as e:
+                msg = f"Dependency command ID {e.args[0]} not found"
+                raise ValueError(msg) from e
+            depender.dependencies += dependees
 
         return rcon_commands.values()
@@ -12,6 +12,7 @@ Packet format reference: https://minecraft.wiki/w/RCON#Packet_format
 
 import asyncio
 import logging
+import random
 import struct
 from dataclasses import dataclass, field
 from typing import ClassVar
@@ -21,7 +22,10 @@ from backend.rconclient.rcon_exceptions import RCONClientIncorrectPasswordError
 from .command import RCONPacketType
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
+
+# length, request id, packet type (little-endian signed 32-bit integers)
+_PACKET_HEADER = struct.Struct("<iii")
+_INT32 = struct.Struct("<i")
 
 
 @dataclass
@@ -31,8 +35,8 @@ class SocketClientConfig:
     :param password: The RCON password
     :param port: The RCON port (default: 25575)
     :param socket_timeout: The socket timeout in seconds (default: None)
-    :param reconnect_pause: Pause duration in seconds before
-        reconnecting (default: None)
+    :param reconnect_pause: Base pause in seconds between connection
+        attempts; later attempts back off with jitter (default: None)
     :param retry_attempts: Number of additional retry attempts after initial try
         (default: INFINITE for unlimited retries)
     """
@@ -55,6 +59,13 @@ class SocketClient:
     # request id (4) + packet type (4) + 2 null bytes (2)
     _PACKET_METADATA_SIZE = 10
 
+    # Upper bound in seconds for the jittered pause between connection attempts
+    _MAX_RECONNECT_PAUSE = 60.0
+
+    # Seconds to let a closing socket flush before aborting it, so a dead
+    # peer cannot hold up a reconnect until the OS gives up on it
+    _CLOSE_TIMEOUT = 1.0
+
     def __init__(
         self,
         reader: asyncio.StreamReader,
@@ -81,37 +92,51 @@ class SocketClient:
         payload: str,
         packet_type: RCONPacketType,
         request_id: int,
-    ) -> bytes:
+    ) -> bytearray:
         """Format a packet to be sent to the RCON server.
 
+        The packet is built in a single pre-sized buffer. The two trailing
+        null bytes come from its zero initialization.
+
         :param payload: The body of the packet
         :param packet_type: The type of the packet (RCONPacketType)
         :param request_id: The request ID for the packet
-        :return: The formatted packet as bytes
+        :return: The formatted packet
         """
         body_bytes = payload.encode("utf-8")
-
-        return (
-            struct.pack("<i", len(body_bytes) + SocketClient._PACKET_METADATA_SIZE)
-            + struct.pack("<i", request_id)
-            + struct.pack("<i", packet_type.value)
-            + body_bytes
-            + b"\x00\x00"
+        body_end = _PACKET_HEADER.size + len(body_bytes)
+
+        packet = bytearray(body_end + 2)
+        _PACKET_HEADER.pack_into(
+            packet,
+            0,
+            len(body_bytes) + SocketClient._PACKET_METADATA_SIZE,
+            request_id,
+            packet_type,
         )
+        packet[_PACKET_HEADER.size : body_end] = body_bytes
+        return packet
 
     @staticmethod
-    async def _read_response(reader: asyncio.StreamReader) -> tuple[int, str, int]:
+    async def _read_response(
+        reader: asyncio.StreamReader,
+    ) -> tuple[int, memoryview]:
         """Read a valid and full command response from the RCON server.
 
+        The body is returned undecoded so that multi-packet responses can be
+        joined before decoding; the server may split a UTF-8 sequence across
+        packets. It is a view into the packet, so no copy is made until the
+        caller decodes or accumulates it.
+
         :param reader: The StreamReader for the RCON socket
-        :return: A tuple of (response_id, response_body, body_byte_length)
+        :return: A tuple of (response_id, body)
 
         :raises ConnectionError: if the socket is no longer connected
         """
         try:
             # get the length
-            response_bytes = await reader.readexactly(4)
-            response_length: int = struct.unpack("<i", response_bytes)[0]
+            response_bytes = await reader.readexactly(_INT32.size)
+            response_length: int = _INT32.unpack(response_bytes)[0]
 
             # rest of response
             response_bytes = await reader.readexactly(response_length)
@@ -119,11 +144,28 @@ class SocketClient:
             msg = "RCON connection closed unexpectedly"
             raise ConnectionError(msg) from e
 
-        response_id: int = struct.unpack("<i", response_bytes[0:4])[0]
-        body_bytes = response_bytes[8:-2]
-        response_body = body_bytes.decode("utf-8")
+        response_id: int = _INT32.unpack_from(response_bytes)[0]
+        return response_id, memoryview(response_bytes)[8:-2]
 
-        return response_id, response_body, len(body_bytes)
+    @staticmethod
+    async def _close(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Close a connection, aborting it if it does not close in time.
+
+        :param reader: The StreamReader for the RCON socket
+        :param writer: The StreamWriter for the RCON socket
+        """
+        reader.feed_eof()
+        writer.close()
+        try:
+            await asyncio.wait_for(
+                writer.wait_closed(),
+                timeout=SocketClient._CLOSE_TIMEOUT,
+            )
+        except TimeoutError:
+            writer.transport.abort()
 
     @staticmethod
     async def _send_auth(
@@ -150,7 +192,7 @@ class SocketClient:
         await asyncio.wait_for(writer.drain(), timeout=socket_timeout)
 
         # Read the single auth response
-        response_id, response_body, _ = await asyncio.wait_for(
+        response_id, response_body = await asyncio.wait_for(
             SocketClient._read_response(reader),
             timeout=socket_timeout,
         )
@@ -158,7 +200,7 @@ class SocketClient:
         if response_id == -1:
             return None
 
-        return response_body
+        return str(response_body, "utf-8")
 
     @staticmethod
     async def _try_connection(
@@ -169,21 +211,33 @@ class SocketClient:
     ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
         """Try connection establishment with retry logic.
 
+        Pauses between attempts use decorrelated jitter backoff: each pause
+        is drawn between ``reconnect_pause`` and three times the previous
+        one, capped at _MAX_RECONNECT_PAUSE. Retries back off while the
+        server is down, and workers that lost their connections together
+        do not retry in lockstep.
+
         :param port: The RCON port to connect to
         :param socket_timeout: The socket timeout in seconds
         :param num_retries: Number of additional retries after initial attempt
                             (use SocketClientConfig.INFINITE for unlimited)
-        :param reconnect_pause: Optional pause between attempts
+        :param reconnect_pause: Optional base pause between attempts
         :return: Connected reader and writer streams
         :raises ConnectionError: If all attempts fail (only for finite retries)
         """
         attempt = 0
         last_exception = None
+        pause = reconnect_pause or 0
+        max_pause = max(SocketClient._MAX_RECONNECT_PAUSE, pause)
 
         while True:
             try:
                 if attempt > 0 and reconnect_pause:
-                    await asyncio.sleep(reconnect_pause)
+                    pause = min(
+                        max_pause,
+                        random.uniform(reconnect_pause, pause * 3),  # noqa: S311
+                    )
+                    await asyncio.sleep(pause)
 
                 return await asyncio.wait_for(
                     asyncio.open_connection("localhost", port),
@@ -247,7 +301,7 @@ class SocketClient:
         await asyncio.wait_for(self._writer.drain(), timeout=self._timeout)
 
         # Read the first response with the full socket timeout
-        response_id, response_body, body_len = await asyncio.wait_for(
+        response_id, response_body = await asyncio.wait_for(
             SocketClient._read_response(self._reader),
             timeout=self._timeout,
         )
@@ -255,38 +309,37 @@ class SocketClient:
         if response_id == -1:
             return None
 
-        response_parts = [response_body] if response_id == request_id else []
-
         # If the body filled the maximum payload, more packets may follow.
         # Keep reading with a short timeout until the stream goes quiet.
-        if body_len >= self._MAX_BODY_SIZE:
-            while True:
-                try:
-                    response_id, response_body, body_len = await asyncio.wait_for(
-                        SocketClient._read_response(self._reader),
-                        timeout=self._MULTI_PACKET_TIMEOUT,
-                    )
-                except (TimeoutError, ConnectionError):
-                    break
+        if len(response_body) < self._MAX_BODY_SIZE:
+            return str(response_body, "utf-8") if response_id == request_id else ""
 
-                if response_id == -1:
-                    return None
+        response = bytearray(response_body if response_id == request_id else b"")
+        while True:
+            try:
+                response_id, response_body = await asyncio.wait_for(
+                    SocketClient._read_response(self._reader),
+                    timeout=self._MULTI_PACKET_TIMEOUT,
+                )
+            except (TimeoutError, ConnectionError):
+                break
 
-                if response_id == request_id:
-                    response_parts.append(response_body)
+            if response_id == -1:
+                return None
 
-                # Last fragment was under the max — no more packets
-                if body_len < self._MAX_BODY_SIZE:
-                    break
+            if response_id == request_id:
+                response += response_body
 
-        return "".join(response_parts)
+            # Last fragment was under the max — no more packets
+            if len(response_body) < self._MAX_BODY_SIZE:
+                break
+
+        return response.decode("utf-8")
 
     async def disconnect(self) -> None:
         """Disconnects from the RCON server and closes the socket (best effort)."""
         try:
-            self._writer.close()
-            await self._writer.wait_closed()
-            self._reader.feed_eof()
+            await SocketClient._close(self._reader, self._writer)
         except Exception:
             # Ignore errors when closing the socket
             LOGGER.exception("Error while closing RCON socket")
@@ -307,21 +360,24 @@ class SocketClient:
             self._reconnect_pause,
         )
 
-        auth_success = await SocketClient._send_auth(
-            self._password,
-            reader,
-            writer,
-            self._timeout,
-        )
+        try:
+            auth_success = await SocketClient._send_auth(
+                self._password,
+                reader,
+                writer,
+                self._timeout,
+            )
+        except BaseException:
+            # also on cancellation, or the new socket would leak
+            await SocketClient._close(reader, writer)
+            raise
 
         if auth_success is not None:
             self._reader, self._writer = reader, writer
             self._request_id = 1
         else:
             # Clean up on auth failure
-            reader.feed_eof()
-            writer.close()
-            await writer.wait_closed()
+            await SocketClient._close(reader, writer)
 
         return auth_success
 
@@ -357,15 +413,11 @@ class SocketClient:
                 config.socket_timeout,
             )
         except (TimeoutError, ConnectionError):
-            reader.feed_eof()
-            writer.close()
-            await writer.wait_closed()
+            await cls._close(reader, writer)
             raise
 
         if auth_success is None:
-            reader.feed_eof()
-            writer.close()
-            await writer.wait_closed()
+            await cls._close(reader, writer)
             msg = "Incorrect RCON password"
             raise RCONClientIncorrectPasswordError(msg)
 
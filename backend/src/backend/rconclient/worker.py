@@ -12,7 +12,9 @@ timing requirements (when the rest of the app exits, for example).
 """
 
 import asyncio
+import contextlib
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar, Self
 
@@ -21,12 +23,11 @@ from .connection import SocketClient, SocketClientConfig
 from .rcon_exceptions import RCONClientIncorrectPasswordError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Collection, Iterable
     from types import TracebackType
 
 
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 
 
 @dataclass
@@ -40,7 +41,7 @@ class RCONWorkerPoolConfig:
     :param port: RCON server port
     :param socket_timeout: Socket timeout in seconds
     :param worker_count: Number of concurrent workers
-    :param reconnect_pause: Seconds to wait between reconnection attempts
+    :param reconnect_pause: Base seconds to wait between reconnection attempts
 
     :param grace_period: Seconds to wait for remaining queue items to process.
         Set to DISABLE to skip graceful processing.
@@ -54,11 +55,16 @@ class RCONWorkerPoolConfig:
         single worker.  Prevents overwhelming the RCON server when commands
         are queued faster than the server can handle them.
         Set to DISABLE (0) to send commands as fast as possible.
+
+    :param max_queue_size: Maximum number of commands waiting for a worker.
+        Queueing beyond it raises :class:`asyncio.QueueFull`.
+        Set to UNBOUNDED (0) for no limit.
     """
 
     NO_TIMEOUT: ClassVar[None] = None
     DISABLE: ClassVar[int] = 0
     INFINITE: ClassVar[int] = SocketClientConfig.INFINITE
+    UNBOUNDED: ClassVar[int] = 0
 
     password: str
     port: int
@@ -70,6 +76,7 @@ class RCONWorkerPoolConfig:
     await_shutdown_period: int | None = field(default=NO_TIMEOUT)
     retry_client_auth_attempts: int = field(default=INFINITE)
     command_delay: float = field(default=DISABLE)
+    max_queue_size: int = field(default=UNBOUNDED)
 
     def __post_init__(self) -> None:
         """Create a SocketClientConfig based on this worker pool configuration."""
@@ -98,17 +105,194 @@ class RCONWorkerPoolState:
     """Runtime state for the RCON worker pool.
 
     This class holds mutable state that can be modified during runtime
-    to signal changes to workers.
+    to signal changes to workers. ``worker_stop`` is set together with
+    ``worker_should_shutdown`` so workers blocked on a reconnect wake up.
     """
 
     pool_should_shutdown: bool = field(default=False)
     worker_should_shutdown: bool = field(default=False)
+    worker_stop: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class _CommandQueue:
+    """FIFO of pending commands shared by the workers of a pool.
+
+    Stands in for :class:`asyncio.Queue`, implementing the subset of its
+    interface the pool relies on plus all-or-nothing batch puts and a
+    single-swap drain. Like :class:`asyncio.Queue`, each idle worker parks
+    on its own future and each queued command wakes exactly one of them.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Create an empty queue that accepts commands.
+
+        :param maxsize: Maximum number of waiting commands, or 0 for no limit
+        """
+        self._maxsize = maxsize
+        self._items: deque[RCONCommand] = deque()
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+        self._unfinished = 0
+        self._is_shutdown = False
+
+    def _wakeup_next(self) -> None:
+        """Wake the longest-waiting idle worker, if there is one."""
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                return
+
+    def qsize(self) -> int:
+        """Return the number of commands waiting to be picked up."""
+        return len(self._items)
+
+    def put_nowait(self, command: RCONCommand) -> None:
+        """Append a command and wake one idle worker.
+
+        :param command: The command to queue
+        :raises asyncio.QueueShutDown: If the queue has been shut down
+        :raises asyncio.QueueFull: If the queue is at its maximum size
+        """
+        if self._is_shutdown:
+            raise asyncio.QueueShutDown
+        if 0 < self._maxsize <= len(self._items):
+            raise asyncio.QueueFull
+        self._items.append(command)
+        self._unfinished += 1
+        self._all_done.clear()
+        self._wakeup_next()
+
+    def put_many(self, commands: Collection[RCONCommand]) -> None:
+        """Append several commands at once and wake one idle worker per command.
+
+        Either every command is queued or, if they do not all fit, none are.
+
+        :param commands: The commands to queue, in order
+        :raises asyncio.QueueShutDown: If the queue has been shut down
+        :raises ValueError: If there are more commands than the maximum size
+        :raises asyncio.QueueFull: If the commands do not fit in the queue
+        """
+        if self._is_shutdown:
+            raise asyncio.QueueShutDown
+        if not commands:
+            return
+        if 0 < self._maxsize < len(commands):
+            msg = (
+                f"Job of {len(commands)} commands exceeds the maximum queue "
+                f"size of {self._maxsize}"
+            )
+            raise ValueError(msg)
+        if 0 < self._maxsize < len(self._items) + len(commands):
+            raise asyncio.QueueFull
+        self._items.extend(commands)
+        self._unfinished += len(commands)
+        self._all_done.clear()
+        for _ in range(min(len(commands), len(self._getters))):
+            self._wakeup_next()
+
+    async def get(self) -> RCONCommand:
+        """Remove and return the oldest command, waiting for one if needed.
+
+        :return: The oldest queued command
+        :raises asyncio.QueueShutDown: If the queue is shut down and empty
+        """
+        while not self._items:
+            if self._is_shutdown:
+                raise asyncio.QueueShutDown
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._getters.remove(getter)
+                # pass on a wakeup this worker received but can no longer use
+                if self._items and not getter.cancelled():
+                    self._wakeup_next()
+                raise
+        return self._items.popleft()
+
+    def drain(self) -> deque[RCONCommand]:
+        """Remove every queued command at once, counting them as processed.
+
+        :return: The commands that were waiting, oldest first
+        """
+        items, self._items = self._items, deque()
+        self._unfinished = max(self._unfinished - len(items), 0)
+        if self._unfinished == 0:
+            self._all_done.set()
+        return items
+
+    def task_done(self) -> None:
+        """Mark a previously retrieved command as processed.
+
+        :raises ValueError: If called more times than commands were queued
+        """
+        if self._unfinished <= 0:
+            msg = "task_done() called too many times"
+            raise ValueError(msg)
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._all_done.set()
+
+    async def join(self) -> None:
+        """Wait until every queued command has been marked as processed."""
+        await self._all_done.wait()
+
+    def shutdown(self, *, immediate: bool = False) -> None:
+        """Stop accepting commands and wake all waiting workers.
+
+        :param immediate: Also discard queued commands, counting them as processed
+        """
+        self._is_shutdown = True
+        if immediate:
+            self._unfinished = max(self._unfinished - len(self._items), 0)
+            self._items.clear()
+            if self._unfinished == 0:
+                self._all_done.set()
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+
+
+async def _reconnect_until_stopped(
+    worker_id: int,
+    client: SocketClient,
+    state: RCONWorkerPoolState,
+) -> None:
+    """Reconnect the client, giving up as soon as the workers are stopped.
+
+    Reconnection retries with backoff and may not finish for a long time
+    while the server is down, so it is abandoned when shutdown begins.
+
+    :param worker_id: Unique identifier for the reconnecting worker
+    :param client: RCON socket client to reconnect
+    :param state: Runtime state object carrying the stop signal
+    :raises ConnectionError: If reconnection fails before shutdown
+    """
+    reconnect = asyncio.ensure_future(client.reconnect())
+    stop = asyncio.ensure_future(state.worker_stop.wait())
+    try:
+        await asyncio.wait((reconnect, stop), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (reconnect, stop):
+            task.cancel()
+        await asyncio.gather(reconnect, stop, return_exceptions=True)
+
+    if reconnect.cancelled():
+        LOGGER.info("Worker %d: Reconnect abandoned for shutdown", worker_id)
+        return
+    reconnect.result()
 
 
 async def _worker(
     worker_id: int,
     client: SocketClient,
-    queue: asyncio.Queue[RCONCommand],
+    queue: _CommandQueue,
     state: RCONWorkerPoolState,
     command_delay: float = 0,
 ) -> None:
@@ -125,19 +309,24 @@ async def _worker(
     """
     LOGGER.info("Worker %d: Starting", worker_id)
 
+    # bound once, these are looked up for every command
+    get_command = queue.get
+    task_done = queue.task_done
+    send_command = client.send_command
+
     while not state.worker_should_shutdown:
         try:
-            command = await queue.get()
+            command = await get_command()
         except asyncio.QueueShutDown:
             break
 
         try:
             if command.dependencies:
                 await asyncio.gather(
-                    *(dep.completion.wait() for dep in command.dependencies),
+                    *(dep.wait_for_completion() for dep in command.dependencies),
                 )
-            response = await client.send_command(command.command)
-            queue.task_done()
+            response = await send_command(command.command)
+            task_done()
 
             if response is None:
                 command.set_command_error(ConnectionError("RCON authentication failed"))
@@ -149,10 +338,9 @@ async def _worker(
                 "Worker %d: Connection error, reconnecting...",
                 worker_id,
             )
-            queue.task_done()
-            if command.result is not None:
-                command.set_command_error(e)
-            await client.reconnect()
+            task_done()
+            command.set_command_error(e)
+            await _reconnect_until_stopped(worker_id, client, state)
             continue
 
         if command_delay > 0:
@@ -187,7 +375,9 @@ class RCONWorkerPool:
         """
         self.config = config
         self.state = RCONWorkerPoolState()
-        self._queue: asyncio.Queue[RCONCommand] = asyncio.Queue()
+        self._queue = _CommandQueue(
+            config.max_queue_size if config else RCONWorkerPoolConfig.UNBOUNDED,
+        )
         self._workers: list[asyncio.Task[None]] = []
         self._clients: list[SocketClient] = []
 
@@ -290,8 +480,8 @@ class RCONWorkerPool:
 
         # queue clear period - fail remaining items
         self.state.worker_should_shutdown = True
-        while self._queue.qsize():
-            command = self._queue.get_nowait()
+        self.state.worker_stop.set()
+        for command in self._queue.drain():
             command.set_command_error(ConnectionError("Processing pool shut down"))
         self._queue.shutdown(immediate=True)
 
@@ -315,12 +505,14 @@ class RCONWorkerPool:
 
         :param command: The command to send to the Minecraft server
         :raises RuntimeError: If the worker pool is shutting down
+        :raises asyncio.QueueFull: If the command queue is full
         """
         if self.state.pool_should_shutdown:
             msg = "Worker pool is shutting down"
             raise RuntimeError(msg)
 
-        LOGGER.debug("Queueing RCON command: %s", command)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Queueing RCON command: %s", command)
         self._queue.put_nowait(command)
 
     async def queue_job(
@@ -331,8 +523,9 @@ class RCONWorkerPool:
 
         :param commands: The list of commands to send to the Minecraft server
         :raises RuntimeError: If the worker pool is shutting down
-        :raises ValueError: If a cycle is detected in command dependencies
-            or duplicate IDs exist.
+        :raises ValueError: If a cycle is detected in command dependencies,
+            duplicate IDs exist, or the job is larger than the command queue.
+        :raises asyncio.QueueFull: If the job does not fit in the command queue
         """
         if self.state.pool_should_shutdown:
             msg = "Worker pool is shutting down"
@@ -341,9 +534,10 @@ class RCONWorkerPool:
         try:
             sorted_commands = RCONCommand.topological_sort(commands)
         except ValueError as e:
-            msg = "Failed to sort commands for job due to cycle or duplicate IDs"
+            msg = f"Failed to sort commands for job due to cycle or duplicate IDs: {e}"
             LOGGER.exception(msg)
             raise ValueError(msg) from e
-        for command in sorted_commands:
-            LOGGER.debug("Queueing RCON command: %s", command)
-            self._queue.put_nowait(command)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for command in sorted_commands:
+                LOGGER.debug("Queueing RCON command: %s", command)
+        self._queue.put_many(sorted_commands)
@@ -0,0 +1,82 @@
+"""Unit tests for the verified token cache of the SecurityManager."""
+
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from backend.app.auth.security_manager import SecurityManager
+from backend.common import Role, User
+
+
+@pytest.fixture
+def security_manager() -> SecurityManager:
+    """Create a security manager with a generated secret key."""
+    return SecurityManager()
+
+
+@pytest.fixture
+def test_user() -> User:
+    """Create a test user with admin role."""
+    return User("testuser", role=Role.ADMIN)
+
+
+def test_cached_token_skips_decode(
+    security_manager: SecurityManager,
+    test_user: User,
+) -> None:
+    """Test that a token verified once is not decoded again."""
+    token = security_manager.create_access_token(test_user)
+
+    with patch(
+        "backend.app.auth.security_manager.jwt.decode",
+        wraps=jwt.decode,
+    ) as mock_decode:
+        assert security_manager.verify_token(token) == test_user
+        assert security_manager.verify_token(token) == test_user
+
+    mock_decode.assert_called_once()
+
+
+def test_expired_cached_token_is_evicted_and_rejected(
+    test_user: User,
+) -> None:
+    """Test that a cached token past its expiry is dropped and rejected."""
+    security_manager = SecurityManager(expire_minutes=-1)
+    token = security_manager.create_access_token(test_user)
+    security_manager._verified_tokens[token] = (test_user, time.time() - 1)  # noqa: SLF001
+
+    assert security_manager.verify_token(token) is None
+    assert token not in security_manager._verified_tokens  # noqa: SLF001
+
+
+def test_invalid_tokens_are_not_cached(
+    security_manager: SecurityManager,
+    test_user: User,
+) -> None:
+    """Test that tokens failing verification never enter the cache."""
+    forged = SecurityManager().create_access_token(test_user)
+    expired = SecurityManager(
+        secret_key=security_manager.secret_key,
+        expire_minutes=-1,
+    ).create_access_token(test_user)
+
+    for token in (forged, expired, "not a token"):
+        assert security_manager.verify_token(token) is None
+
+    assert security_manager._verified_tokens == {}  # noqa: SLF001
+
+
+def test_cache_is_cleared_when_full(security_manager: SecurityManager) -> None:
+    """Test that the cache is emptied once it reaches its maximum size."""
+    tokens = [
+        security_manager.create_access_token(User(f"user{i}", role=Role.USER))
+        for i in range(3)
+    ]
+
+    with patch.object(SecurityManager, "VERIFIED_TOKEN_CACHE_SIZE", 2):
+        for token in tokens:
+            assert security_manager.verify_token(token) is not None
+
+    assert list(security_manager._verified_tokens) == [tokens[2]]  # noqa: SLF001
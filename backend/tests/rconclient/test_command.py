@@ -55,6 +55,33 @@ async def test_set_command_error_with_future(test_user: User) -> None:
         await command.get_command_result()
 
 
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_complete_command(test_user: User) -> None:
+    """Test that cancelling a result waiter leaves the command pending."""
+    future = asyncio.get_running_loop().create_future()
+    command = RCONCommand(command="list", user=test_user, result=future)
+
+    waiter = asyncio.create_task(command.get_command_result())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert not future.done()
+    command.set_command_result("done")
+    await asyncio.wait_for(command.wait_for_completion(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_fire_and_forget(test_user: User) -> None:
+    """Test that fire-and-forget commands still signal completion."""
+    command = RCONCommand(command="say hi", user=test_user)
+    command.set_command_error(RuntimeError("THIS IS A TEST EXCEPTION"))
+
+    await asyncio.wait_for(command.wait_for_completion(), timeout=1)
+    assert await command.get_command_result() is None
+
+
 @pytest.mark.asyncio
 async def test_add_dependency(test_user: User) -> None:
     """Test adding a dependency to an RCONCommand."""
@@ -120,6 +147,22 @@ async def test_topological_sort_simple(test_user: User) -> None:
     assert [c.command_id for c in sorted_commands] == [1, 2]
 
 
+@pytest.mark.asyncio
+async def test_topological_sort_external_dependency_with_shared_id(
+    test_user: User,
+) -> None:
+    """Verify an outside dependency is not confused with a same-ID command."""
+    external = RCONCommand(command="setup", user=test_user, command_id=1)
+    first = RCONCommand(command="list", user=test_user, command_id=1)
+    second = RCONCommand(command="say Hello", user=test_user, command_id=2)
+    second.add_dependency(external)
+
+    sorted_commands = RCONCommand.topological_sort([first, second])
+
+    assert len(sorted_commands) == 3  # noqa: PLR2004
+    assert sorted_commands.index(external) < sorted_commands.index(second)
+
+
 @pytest.mark.asyncio
 async def test_topological_sort_cycle(test_user: User) -> None:
     """Ensures that circular dependencies are properly detected."""
@@ -193,6 +236,8 @@ async def test_topological_sort_complex_cycle_detection(test_user: User) -> None
         RCONCommand.topological_sort(commands)
 
     assert "Cycle detected" in str(exc_info.value)
+    # command 6 only depends on the cycle and is not part of it
+    assert "[1, 2, 3, 4, 5]" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
@@ -218,3 +263,18 @@ async def test_topological_sort_disconnected_components(test_user: User) -> None
     assert position[1] < position[2], "Command 1 should come before command 2"
     assert position[2] < position[3], "Command 2 should come before command 3"
     assert position[4] < position[5], "Command 4 should come before command 5"
+
+
+@pytest.mark.asyncio
+async def test_topological_sort_long_chain(test_user: User) -> None:
+    """Test that a dependency chain deeper than the recursion limit sorts."""
+    depth = 5000
+    specs = [RCONCommandSpecification(id=0, cmd="command0")] + [
+        RCONCommandSpecification(id=i, cmd=f"command{i}", dependencies=[i - 1])
+        for i in range(1, depth)
+    ]
+
+    commands = RCONCommand.create_job_from_specification(specs[::-1], test_user)
+    sorted_commands = RCONCommand.topological_sort(commands)
+
+    assert [cmd.command_id for cmd in sorted_commands] == list(range(depth))
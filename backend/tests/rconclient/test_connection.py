@@ -7,6 +7,7 @@ failure scenarios that can occur with Minecraft servers.
 """
 
 import asyncio
+import struct
 from io import BytesIO
 from unittest.mock import patch
 
@@ -171,6 +172,27 @@ class TestSocketClientCommandExecution:
 
             assert result == full_body + full_body + "tail"
 
+    async def test_send_command_joins_utf8_split_across_packets(
+        self,
+        socket_config: SocketClientConfig,
+    ) -> None:
+        """Test that a multi-byte character split between packets is decoded."""
+        body = ("A" * 4095 + "é" + "tail").encode()
+        responses = create_response_data([("", RCONPacketType.AUTH_PACKET, 0)])
+        for chunk in (body[:4096], body[4096:]):
+            responses += struct.pack("<iii", len(chunk) + 10, 2, 0) + chunk + b"\0\0"
+
+        with patch("socket.socket"), patch("asyncio.open_connection") as mock_open_conn:
+            reader = MockStreamReader(responses)
+            writer = MockStreamWriter()
+            mock_open_conn.return_value = (reader, writer)
+
+            client = await SocketClient.get_new_client(socket_config)
+
+            result = await client.send_command("help")
+
+            assert result == "A" * 4095 + "é" + "tail"
+
     async def test_send_command_handles_empty_response(
         self,
         socket_config: SocketClientConfig,
@@ -6,22 +6,20 @@ graceful shutdown, and error handling scenarios.
 """
 
 import asyncio
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from backend.common.user import Role, User
 from backend.rconclient.command import RCONCommand
+from backend.rconclient.connection import SocketClient
 from backend.rconclient.rcon_exceptions import RCONClientIncorrectPasswordError
 from backend.rconclient.worker import (
     RCONWorkerPool,
     RCONWorkerPoolConfig,
+    _CommandQueue,
 )
 
-if TYPE_CHECKING:
-    from unittest.mock import MagicMock
-
 DEFAULT_PORT = 25575
 TEST_TIMEOUT = 30
 DEFUALT_PAUSE = 5
@@ -125,6 +123,42 @@ class TestFailRemainingCommands:
             await future2
 
 
+@pytest.mark.asyncio
+class TestCommandQueue:
+    """Test suite for the queue shared by the workers of a pool."""
+
+    async def test_each_command_wakes_one_idle_worker(self, test_user: User) -> None:
+        """Test that queueing wakes one waiting worker per command, not all."""
+        queue = _CommandQueue()
+        wakeups = 0
+
+        async def count_wakeups() -> None:
+            nonlocal wakeups
+            while True:
+                await queue.get()
+                wakeups += 1
+
+        workers = [asyncio.create_task(count_wakeups()) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(queue._getters) == len(workers)  # noqa: SLF001
+
+        queue.put_nowait(RCONCommand(command="list", user=test_user))
+        await asyncio.sleep(0)
+        assert wakeups == 1
+        assert len(queue._getters) == len(workers)  # noqa: SLF001
+
+        queue.put_many(
+            [RCONCommand(command="list", user=test_user, command_id=i) for i in (1, 2)],
+        )
+        await asyncio.sleep(0)
+        assert wakeups == 3  # noqa: PLR2004
+        assert len(queue._getters) == len(workers)  # noqa: SLF001
+
+        queue.shutdown()
+        await asyncio.gather(*workers, return_exceptions=True)
+        assert all(isinstance(w.exception(), asyncio.QueueShutDown) for w in workers)
+
+
 @pytest.mark.asyncio
 class TestRCONWorkerPool:
     """Test suite for RCONWorkerPool functionality."""
@@ -186,6 +220,37 @@ class TestRCONWorkerPool:
             result = await asyncio.wait_for(future, timeout=2.0)
             assert result == "test response"
 
+    @patch("backend.rconclient.worker.SocketClient.get_new_client")
+    async def test_multiple_workers_drain_shared_queue(
+        self,
+        mock_get_client: MagicMock,
+        worker_config: RCONWorkerPoolConfig,
+        mock_socket_client: AsyncMock,
+        test_user: User,
+    ) -> None:
+        """Test that several workers together process every queued command."""
+        mock_get_client.return_value = mock_socket_client
+        worker_config.worker_count = 3
+
+        async with RCONWorkerPool(worker_config) as pool:
+            commands = [
+                RCONCommand(
+                    command=f"say {i}",
+                    user=test_user,
+                    command_id=i,
+                    result=asyncio.get_running_loop().create_future(),
+                )
+                for i in range(10)
+            ]
+            for command in commands:
+                await pool.queue_command(command)
+
+            results = await asyncio.wait_for(
+                asyncio.gather(*(cmd.get_command_result() for cmd in commands)),
+                timeout=2.0,
+            )
+            assert results == ["test response"] * len(commands)
+
     @patch("backend.rconclient.worker.SocketClient.get_new_client")
     async def test_queue_command_during_shutdown(
         self,
@@ -212,6 +277,56 @@ class TestRCONWorkerPool:
         with pytest.raises(RuntimeError, match="pool is shutting down"):
             await pool.queue_job(commands)
 
+    @patch("backend.rconclient.worker.SocketClient.get_new_client")
+    async def test_queue_rejects_commands_when_full(
+        self,
+        mock_get_client: MagicMock,
+        worker_config: RCONWorkerPoolConfig,
+        mock_socket_client: AsyncMock,
+        test_user: User,
+    ) -> None:
+        """Test that a bounded queue rejects commands instead of growing."""
+        mock_get_client.return_value = mock_socket_client
+        worker_config.max_queue_size = 2
+        pool = RCONWorkerPool(worker_config)
+
+        for i in range(2):
+            await pool.queue_command(
+                RCONCommand(command="list", user=test_user, command_id=i),
+            )
+
+        with pytest.raises(asyncio.QueueFull):
+            await pool.queue_command(
+                RCONCommand(command="list", user=test_user, command_id=2),
+            )
+
+        with pytest.raises(asyncio.QueueFull):
+            await pool.queue_job(
+                [RCONCommand(command="list", user=test_user, command_id=3)],
+            )
+
+        await pool.connect()
+        await pool.shutdown()
+
+    async def test_queue_rejects_job_larger_than_queue(
+        self,
+        worker_config: RCONWorkerPoolConfig,
+        test_user: User,
+    ) -> None:
+        """Test that a job that can never fit is rejected, not reported full."""
+        worker_config.max_queue_size = 2
+        pool = RCONWorkerPool(worker_config)
+
+        with pytest.raises(ValueError, match="exceeds the maximum queue size"):
+            await pool.queue_job(
+                [
+                    RCONCommand(command="list", user=test_user, command_id=i)
+                    for i in range(3)
+                ],
+            )
+
+        assert pool._queue.qsize() == 0  # noqa: SLF001
+
     @patch("backend.rconclient.worker.SocketClient.get_new_client")
     async def test_queue_job_with_dependencies(
         self,
@@ -307,3 +422,52 @@ class TestRCONWorkerPool:
             await asyncio.sleep(0.5)
 
             mock_client.send_command.assert_called_once_with("list")
+
+    @patch("backend.rconclient.worker.SocketClient.get_new_client")
+    async def test_shutdown_interrupts_reconnect(
+        self,
+        mock_get_client: MagicMock,
+        worker_config: RCONWorkerPoolConfig,
+        test_user: User,
+    ) -> None:
+        """Test that shutdown interrupts a reconnect and closes its new socket."""
+        auth_started = asyncio.Event()
+
+        async def auth_forever(*_: object) -> None:
+            auth_started.set()
+            await asyncio.Event().wait()
+
+        old_writer = MagicMock(wait_closed=AsyncMock())
+        new_writer = MagicMock(wait_closed=AsyncMock())
+        client = SocketClient(
+            MagicMock(),
+            old_writer,
+            worker_config.socket_client_config,
+        )
+        mock_get_client.return_value = client
+        worker_config.await_shutdown_period = RCONWorkerPoolConfig.NO_TIMEOUT
+
+        with (
+            patch.object(
+                client,
+                "send_command",
+                side_effect=ConnectionError("Connection lost"),
+            ),
+            patch.object(
+                SocketClient,
+                "_try_connection",
+                return_value=(MagicMock(), new_writer),
+            ),
+            patch.object(SocketClient, "_send_auth", side_effect=auth_forever),
+        ):
+            pool = RCONWorkerPool(worker_config)
+            await pool.connect()
+            await pool.queue_command(
+                RCONCommand(command="list", user=test_user, command_id=1),
+            )
+            await asyncio.wait_for(auth_started.wait(), timeout=2.0)
+
+            await asyncio.wait_for(pool.shutdown(), timeout=2.0)
+
+        old_writer.close.assert_called()
+        new_writer.close.assert_called_once()